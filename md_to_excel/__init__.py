@@ -0,0 +1,21 @@
+"""
+Convert the first Markdown table in a file to a formatted Excel spreadsheet.
+
+The public API lives in md_to_excel.converter and is re-exported here. It is
+loaded on first attribute access, so running ``python -m md_to_excel.converter``
+does not import the module twice.
+"""
+
+__all__ = [
+    'convert_many',
+    'markdown_table_to_excel_with_formatting',
+    'parse_markdown',
+    'write_xlsx',
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from md_to_excel import converter
+        return getattr(converter, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
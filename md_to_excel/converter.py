@@ -7,8 +7,10 @@ formatted Excel (.xlsx) spreadsheet. The script preserves basic Markdown
 formatting (bold, italic) and handles HTML line breaks within cells.
 
 Dependencies:
-    - pandas: For data manipulation and DataFrame operations
     - openpyxl: For Excel file creation and formatting (optional but recommended)
+    - lxml: Used by openpyxl for faster .xlsx serialization (optional)
+    - xlsxwriter: Alternative streaming Excel backend (optional)
+    - Cython: Builds the optional compiled row tokenizer in _parser.pyx
 
 Usage:
     python md_to_excel.py -i input.md -o output.xlsx
@@ -18,20 +20,60 @@ Version: 1.0.0
 """
 
 import argparse
+import itertools
+import logging
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Optional, Tuple
 
-import pandas as pd
-
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Alignment, Font
-    from openpyxl.utils.dataframe import dataframe_to_rows
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
+    
+    # Shared styles so every formatted cell references the same style object
+    _BOLD_FONT = Font(bold=True)
+    _ITALIC_FONT = Font(italic=True)
+    _HEADER_FONT = Font(bold=True)
+    _WRAP_ALIGN = Alignment(wrap_text=True, vertical='top', horizontal='left')
+    _STYLE_FONTS = {'bold': _BOLD_FONT, 'italic': _ITALIC_FONT}
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    # openpyxl picks lxml up automatically; it is imported here only to detect it
+    import lxml  # noqa: F401
+    _USING_LXML = True
+except ImportError:
+    _USING_LXML = False
+
+_log = logging.getLogger(__name__)
+_lxml_hint_logged = False
+
+# Precompiled patterns used by the per-line/per-cell parsing helpers
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+# A separator row's inner content: pipe-delimited columns that are either
+# blank or made of dashes, colons and spaces with at least one dash
+_SEP_COLUMN = r'(?:[:\s]*-[:\s-]*|\s*)'
+_SEPARATOR_INNER_RE = re.compile(_SEP_COLUMN + r'(?:\|' + _SEP_COLUMN + r')*')
+
+# Cell values shorter than this are interned
+_INTERN_MAX_LENGTH = 64
+
+# The line-level helpers (parse_markdown_table_line, is_separator_line) expect
+# lines that are already stripped; parse_markdown_table strips each line once.
+
 
 def unescape_markdown_cell(text: str) -> str:
     """
@@ -50,6 +92,58 @@ def unescape_markdown_cell(text: str) -> str:
     return text.replace('\\|', '|').replace('\\\\', '\\')
 
 
+def _split_and_unescape(inner: str) -> List[str]:
+    """
+    Split the inner part of a table row into cells and unescape them.
+    
+    Scans the string once from left to right: every unescaped pipe ends a
+    cell, while escaped pipes (\\|) and escaped backslashes (\\\\) are
+    collapsed into their literal characters as they are encountered.
+    
+    Args:
+        inner: The row content without its leading and trailing pipes
+        
+    Returns:
+        List of raw (unstripped) cell contents
+    """
+    backslash = inner.find('\\')
+    if backslash < 0:
+        # Nothing is escaped, so every pipe is a delimiter
+        return inner.split('|')
+    
+    cells = []
+    parts = []
+    start = 0
+    pipe = inner.find('|')
+    
+    while True:
+        if backslash >= 0 and (pipe < 0 or backslash < pipe):
+            escaped = inner[backslash + 1:backslash + 2]
+            if escaped == '|' or escaped == '\\':
+                parts.append(inner[start:backslash])
+                start = backslash + 1
+                if escaped == '|':
+                    pipe = inner.find('|', start + 1)
+            backslash = inner.find('\\', backslash + 2)
+        elif pipe >= 0:
+            parts.append(inner[start:pipe])
+            cells.append(''.join(parts))
+            parts = []
+            start = pipe + 1
+            pipe = inner.find('|', start)
+        else:
+            parts.append(inner[start:])
+            cells.append(''.join(parts))
+            return cells
+
+
+try:
+    # Compiled tokenizer, available once md_to_excel/_parser.pyx has been built
+    from md_to_excel._parser import split_and_unescape as _split_and_unescape
+except ImportError:
+    pass
+
+
 def preprocess_cell_content(text: Optional[str]) -> str:
     """
     Preprocess cell content by converting HTML breaks to newlines.
@@ -68,11 +162,11 @@ def preprocess_cell_content(text: Optional[str]) -> str:
     
     text = str(text)
     # Replace <br> variants (case-insensitive) with newline
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = _BR_RE.sub('\n', text)
     return text.strip()
 
 
-def parse_markdown_table_line(line: str) -> Optional[List[str]]:
+def parse_markdown_table_line(stripped: str) -> Optional[List[str]]:
     """
     Parse a single line of a Markdown table into its constituent cells.
     
@@ -81,30 +175,31 @@ def parse_markdown_table_line(line: str) -> Optional[List[str]]:
     preprocessed to handle HTML content and Markdown escaping.
     
     Args:
-        line: A single line from the Markdown file
+        stripped: A single line from the Markdown file, already stripped of
+            surrounding whitespace
         
     Returns:
         List of preprocessed cell contents, or None if the line is not a valid table row
     """
-    line = line.strip()
-    if not line.startswith('|') or not line.endswith('|'):
+    if not stripped.startswith('|') or not stripped.endswith('|'):
         return None
     
-    inner = line[1:-1]
-    
-    # Split only on unescaped pipes: a '|' not preceded by a backslash
-    raw_cells = re.split(r'(?<!\\)\|', inner)
+    # Split on unescaped pipes and unescape each cell in a single pass
+    raw_cells = _split_and_unescape(stripped[1:-1])
     
-    # Unescape special characters and preprocess each cell
-    preprocessed_cells = [
-        preprocess_cell_content(unescape_markdown_cell(cell.strip()))
-        for cell in raw_cells
-    ]
+    # Preprocess each cell, interning short values so repeated ones
+    # (e.g. category columns) share a single string object
+    preprocessed_cells = []
+    for cell in raw_cells:
+        text = preprocess_cell_content(cell)
+        if len(text) < _INTERN_MAX_LENGTH:
+            text = sys.intern(text)
+        preprocessed_cells.append(text)
     
     return preprocessed_cells
 
 
-def is_separator_line(line: str) -> bool:
+def is_separator_line(stripped: str) -> bool:
     """
     Check if a line is a Markdown table separator row.
     
@@ -113,53 +208,89 @@ def is_separator_line(line: str) -> bool:
     of such lines.
     
     Args:
-        line: A single line from the Markdown file
+        stripped: A single line from the Markdown file, already stripped of
+            surrounding whitespace
         
     Returns:
         True if the line is a valid table separator, False otherwise
     """
-    line = line.strip()
-    if not line.startswith('|') or not line.endswith('|'):
+    if not stripped.startswith('|') or not stripped.endswith('|'):
         return False
     
-    inner = line[1:-1]
-    cols = [cell.strip() for cell in re.split(r'(?<!\\)\|', inner)]
+    # Validate all column separators in one match (allows dashes, colons, and spaces)
+    return _SEPARATOR_INNER_RE.fullmatch(stripped[1:-1]) is not None
+
+
+def _strip_markdown_markers(value: str) -> Tuple[str, Optional[str]]:
+    """
+    Detect the Markdown formatting markers (**, *, _) wrapping a cell value.
     
-    if not cols:
-        return False
+    Backend-independent core of apply_cell_formatting.
     
-    # Validate each column separator (allows dashes, colons, and spaces)
-    return all(re.fullmatch(r'[:\s-]*-+[:\s-]*', col or '-') for col in cols)
+    Args:
+        value: The cell content as a string
+        
+    Returns:
+        Tuple of (cleaned_text, style) where style is 'bold', 'italic' or None
+    """
+    # Most cells carry no markers, so reject them with the cheapest checks first
+    n = len(value)
+    if n < 3:
+        return value, None
+    
+    c0 = value[0]
+    if c0 != '*' and c0 != '_':
+        return value, None
+    
+    # Check for bold formatting (**)
+    if n > 4 and value.startswith('**') and value.endswith('**'):
+        return value[2:-2].strip(), 'bold'
+    
+    # Check for italic formatting (* or _)
+    if value[-1] == c0:
+        return value[1:-1].strip(), 'italic'
+    
+    return value, None
 
 
-def apply_cell_formatting(cell, value: str) -> Tuple[str, Optional[Font]]:
+def apply_cell_formatting(value: str) -> Tuple[str, Optional['Font']]:
     """
-    Apply Markdown formatting to an Excel cell.
+    Resolve the Markdown formatting of a cell value.
     
     Detects Markdown formatting markers (**, *, _) and returns the cleaned
-    text along with the appropriate Excel font formatting.
+    text along with the appropriate Excel font formatting. No cell is
+    touched, so callers can create each cell once with its final value.
     
     Args:
-        cell: The Excel cell object to format
         value: The cell content as a string
         
     Returns:
         Tuple of (cleaned_text, font_object) where font_object may be None
     """
-    cleaned_value = value
-    font_to_apply = None
+    cleaned_value, style = _strip_markdown_markers(value)
+    return cleaned_value, _STYLE_FONTS[style] if style else None
+
+
+def _longest_line_length(text: str) -> int:
+    """
+    Return the length of the longest line in a possibly multi-line string.
     
-    # Check for bold formatting (**)
-    if value.startswith('**') and value.endswith('**') and len(value) > 4:
-        cleaned_value = value[2:-2].strip()
-        font_to_apply = Font(bold=True)
-    # Check for italic formatting (* or _)
-    elif ((value.startswith('*') and value.endswith('*')) or 
-          (value.startswith('_') and value.endswith('_'))) and len(value) > 2:
-        cleaned_value = value[1:-1].strip()
-        font_to_apply = Font(italic=True)
+    Walks the newlines with str.find so no list of lines is allocated.
     
-    return cleaned_value, font_to_apply
+    Args:
+        text: The cell content, lines separated by newline characters
+        
+    Returns:
+        Length of the longest line
+    """
+    longest = 0
+    start = 0
+    while True:
+        newline = text.find('\n', start)
+        if newline < 0:
+            return max(longest, len(text) - start)
+        longest = max(longest, newline - start)
+        start = newline + 1
 
 
 def parse_markdown_table(lines: List[str]) -> Tuple[List[str], List[List[str]], bool]:
@@ -181,60 +312,129 @@ def parse_markdown_table(lines: List[str]) -> Tuple[List[str], List[List[str]],
     """
     headers = []
     data_rows = []
+    bad_rows = []
     header_found = False
     separator_found = False
-    table_found = False
     
-    print("Processing Markdown content...")
+    _log.info("Processing Markdown content...")
     
+    # Phase 1: skip prose until the first line that parses as a table row.
+    # The prefix check rejects prose lines before any parsing work is done.
+    start = len(lines)
     for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith('|'):
+            parsed_cols = parse_markdown_table_line(stripped)
+            if parsed_cols is not None:
+                headers = parsed_cols
+                header_found = True
+                start = i + 1
+                _log.debug("  Found header on line %d: %s", i + 1, headers)
+                break
+    
+    # Phase 2: separator and data rows, until the table ends
+    for i in range(start, len(lines)):
+        stripped = lines[i].strip()
+        is_table_line = stripped.startswith('|')
+        
         # Check for separator first
-        if header_found and not separator_found:
-            if is_separator_line(line):
-                separator_found = True
-                print(f"  Found separator on line {i+1}")
-                continue
+        if is_table_line and not separator_found and is_separator_line(stripped):
+            separator_found = True
+            _log.debug("  Found separator on line %d", i + 1)
+            continue
         
         # Parse potential table row
-        parsed_cols = parse_markdown_table_line(line)
+        parsed_cols = parse_markdown_table_line(stripped) if is_table_line else None
         
         if parsed_cols is not None:
-            if not header_found:
-                headers = parsed_cols
-                header_found = True
-                table_found = True
-                print(f"  Found header on line {i+1}: {headers}")
-            elif separator_found:
+            if separator_found:
                 if len(parsed_cols) != len(headers):
-                    print(f"  Warning: Row {i+1} has {len(parsed_cols)} columns, "
-                          f"expected {len(headers)}")
+                    bad_rows.append(i + 1)
                 data_rows.append(parsed_cols)
-            elif header_found and not separator_found:
-                print(f"Error: Found table data on line {i+1} before separator line")
+            else:
+                _log.error("Error: Found table data on line %d before separator line", i + 1)
                 return headers, data_rows, False
         
-        elif table_found and separator_found:
-            print(f"  Table ended after line {i}")
+        elif separator_found:
+            _log.debug("  Table ended after line %d", i)
             break
     
     # Validate table structure
     if not header_found:
-        print("Error: No Markdown table header found")
+        _log.error("Error: No Markdown table header found")
         return headers, data_rows, False
     
     if not separator_found:
-        print("Error: No separator line found after header")
+        _log.error("Error: No separator line found after header")
         return headers, data_rows, False
     
+    if bad_rows:
+        _log.warning("  Warning: %d malformed rows (column count differs from the "
+                     "header's %d) at lines %s%s", len(bad_rows), len(headers),
+                     bad_rows[:10], "..." if len(bad_rows) > 10 else "")
+    
     if not data_rows:
-        print("Warning: No data rows found in table")
+        _log.warning("Warning: No data rows found in table")
+    
+    _log.info("  Found table on line %d: %d rows × %d columns",
+              start, len(data_rows), len(headers))
     
     return headers, data_rows, True
 
 
-def create_formatted_excel(df: pd.DataFrame, excel_path: str) -> bool:
+def _column_width(max_length: int) -> float:
     """
-    Create a formatted Excel file from a pandas DataFrame.
+    Convert the longest line length of a column into an Excel column width.
+    
+    Args:
+        max_length: Length of the longest line in the column
+        
+    Returns:
+        Reasonable column width (max 60 characters, min 8)
+    """
+    return max(min((max_length + 3) * 1.1, 60), 8)
+
+
+def _column_max_lengths(headers: List[str], data_rows: List[List[str]]) -> List[int]:
+    """
+    Measure the longest cleaned line of every column.
+    
+    Args:
+        headers: List of column headers
+        data_rows: List of lists containing row data
+        
+    Returns:
+        Longest line length per column, with Markdown markers removed
+    """
+    column_widths = [0] * len(headers)
+    for row in itertools.chain([headers], data_rows):
+        for col_idx, value in enumerate(row):
+            if value:
+                cleaned_value, _ = _strip_markdown_markers(str(value))
+                if cleaned_value:
+                    longest = _longest_line_length(cleaned_value)
+                    if longest > column_widths[col_idx]:
+                        column_widths[col_idx] = longest
+    return column_widths
+
+
+def _ensure_output_dir(excel_path: str) -> None:
+    """
+    Create the parent directory of the output file if it does not exist.
+    
+    Args:
+        excel_path: Path where the Excel file will be saved
+    """
+    output_dir = os.path.dirname(excel_path)
+    if output_dir and not os.path.exists(output_dir):
+        _log.info("Creating output directory: %s", output_dir)
+        os.makedirs(output_dir)
+
+
+def create_formatted_excel(headers: List[str], data_rows: List[List[str]],
+                           excel_path: str) -> bool:
+    """
+    Create a formatted Excel file from parsed table headers and rows.
     
     Applies professional formatting including:
     - Bold headers
@@ -244,90 +444,221 @@ def create_formatted_excel(df: pd.DataFrame, excel_path: str) -> bool:
     - Top-left alignment for readability
     
     Args:
-        df: The pandas DataFrame to export
+        headers: List of column headers
+        data_rows: List of lists containing row data; short rows are padded
+            with empty cells
         excel_path: Path where the Excel file should be saved
         
     Returns:
         True if successful, False if an error occurred
     """
     if not OPENPYXL_AVAILABLE:
-        print("Error: openpyxl library is required for formatting")
-        print("Install with: pip install openpyxl")
+        _log.error("Error: openpyxl library is required for formatting\n"
+                   "Install with: pip install openpyxl")
         return False
     
+    global _lxml_hint_logged
+    if not _USING_LXML and not _lxml_hint_logged:
+        _log.warning("Warning: lxml is not installed; install it with "
+                     "'pip install lxml' for faster .xlsx writes")
+        _lxml_hint_logged = True
+    
     try:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Table Data"
-        
-        # Write headers and data
-        ws.append(df.columns.tolist())
-        for row in dataframe_to_rows(df, index=False, header=False):
-            ws.append(row)
-        
-        print("Applying Excel formatting...")
-        
-        # Define styles
-        header_font = Font(bold=True)
-        wrap_alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
-        
-        # Format header row
-        for cell in ws[1]:
-            if cell.value is not None:
-                cleaned_value, _ = apply_cell_formatting(cell, str(cell.value))
-                cell.value = cleaned_value
-                cell.font = header_font
-            cell.alignment = wrap_alignment
-        
-        # Format data rows
-        for row_idx in range(2, ws.max_row + 1):
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                
-                if cell.value is not None:
-                    cleaned_value, font_style = apply_cell_formatting(cell, str(cell.value))
-                    cell.value = cleaned_value
+        # Write-only mode streams cells straight to the XML writer
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Table Data")
+        
+        num_columns = len(headers)
+        
+        # Column widths must be set before the first row is streamed, so they
+        # are measured in a pass of their own rather than by holding every cell
+        _log.debug("Adjusting column widths...")
+        column_widths = _column_max_lengths(headers, data_rows)
+        for col_idx, max_length in enumerate(column_widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = _column_width(max_length)
+        
+        _log.info("Applying Excel formatting...")
+        
+        # Write header row
+        header_row = []
+        for header in headers:
+            if header is not None:
+                cleaned_value, _ = apply_cell_formatting(str(header))
+                cell = WriteOnlyCell(ws, value=cleaned_value)
+                cell.font = _HEADER_FONT
+            else:
+                cell = WriteOnlyCell(ws)
+            cell.alignment = _WRAP_ALIGN
+            header_row.append(cell)
+        ws.append(header_row)
+        
+        # Stream data rows straight from the parsed lists, one row at a time
+        for values in data_rows:
+            row_cells = []
+            for value in values:
+                if value is not None:
+                    cleaned_value, font_style = apply_cell_formatting(str(value))
+                    cell = WriteOnlyCell(ws, value=cleaned_value)
                     if font_style:
                         cell.font = font_style
-                
-                cell.alignment = wrap_alignment
-        
-        # Adjust column widths
-        print("Adjusting column widths...")
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                if cell.value:
-                    try:
-                        cell_lines = str(cell.value).split('\n')
-                        max_line_length = max(len(line) for line in cell_lines) if cell_lines else 0
-                        max_length = max(max_length, max_line_length)
-                    except Exception:
-                        continue
-            
-            # Set reasonable column width (max 60 characters, min 8)
-            adjusted_width = min((max_length + 3) * 1.1, 60)
-            ws.column_dimensions[column_letter].width = max(adjusted_width, 8)
-        
-        # Ensure output directory exists
-        output_dir = os.path.dirname(excel_path)
-        if output_dir and not os.path.exists(output_dir):
-            print(f"Creating output directory: {output_dir}")
-            os.makedirs(output_dir)
+                else:
+                    cell = WriteOnlyCell(ws)
+                cell.alignment = _WRAP_ALIGN
+                row_cells.append(cell)
+            # Pad short rows with empty, formatted cells
+            for _ in range(num_columns - len(values)):
+                cell = WriteOnlyCell(ws)
+                cell.alignment = _WRAP_ALIGN
+                row_cells.append(cell)
+            ws.append(row_cells)
+        
+        _ensure_output_dir(excel_path)
         
         # Save the workbook
         wb.save(excel_path)
-        print(f"Successfully saved formatted Excel file: '{excel_path}'")
+        _log.info("Successfully saved formatted Excel file: '%s'", excel_path)
+        return True
+        
+    except Exception as e:
+        _log.error("Error creating Excel file '%s': %s", excel_path, e)
+        return False
+
+
+def create_formatted_excel_xlsxwriter(headers: List[str], data_rows: List[List[str]],
+                                      excel_path: str) -> bool:
+    """
+    Create a formatted Excel file using the xlsxwriter backend.
+    
+    Produces the same formatting as create_formatted_excel, but streams rows
+    to disk with xlsxwriter's constant-memory mode, which scales better for
+    very large tables.
+    
+    Args:
+        headers: List of column headers
+        data_rows: List of lists containing row data; short rows are padded
+            with empty cells
+        excel_path: Path where the Excel file should be saved
+        
+    Returns:
+        True if successful, False if an error occurred
+    """
+    if not XLSXWRITER_AVAILABLE:
+        _log.error("Error: xlsxwriter library is required for this backend\n"
+                   "Install with: pip install xlsxwriter")
+        return False
+    
+    try:
+        _ensure_output_dir(excel_path)
+        
+        wb = xlsxwriter.Workbook(excel_path, {'constant_memory': True, 'in_memory': False})
+        ws = wb.add_worksheet("Table Data")
+        
+        # Formats combine font and alignment, so build one per font variant
+        wrap = {'text_wrap': True, 'valign': 'top', 'align': 'left'}
+        wrap_format = wb.add_format(wrap)
+        style_formats = {
+            'bold': wb.add_format(dict(wrap, bold=True)),
+            'italic': wb.add_format(dict(wrap, italic=True)),
+        }
+        header_format = style_formats['bold']
+        
+        num_columns = len(headers)
+        column_widths = [0] * num_columns
+        
+        _log.info("Applying Excel formatting...")
+        
+        # Write header row
+        for col_idx, header in enumerate(headers):
+            if header is None:
+                ws.write_blank(0, col_idx, None, header_format)
+                continue
+            cleaned_value, _ = _strip_markdown_markers(str(header))
+            ws.write_string(0, col_idx, cleaned_value, header_format)
+            if cleaned_value:
+                column_widths[col_idx] = _longest_line_length(cleaned_value)
+        
+        # Write data rows in order, as constant-memory mode requires
+        for row_idx, values in enumerate(data_rows, 1):
+            for col_idx in range(num_columns):
+                value = values[col_idx] if col_idx < len(values) else None
+                if value is None:
+                    ws.write_blank(row_idx, col_idx, None, wrap_format)
+                    continue
+                cleaned_value, style = _strip_markdown_markers(str(value))
+                cell_format = style_formats[style] if style else wrap_format
+                ws.write_string(row_idx, col_idx, cleaned_value, cell_format)
+                if cleaned_value:
+                    longest = _longest_line_length(cleaned_value)
+                    if longest > column_widths[col_idx]:
+                        column_widths[col_idx] = longest
+        
+        _log.debug("Adjusting column widths...")
+        for col_idx, max_length in enumerate(column_widths):
+            ws.set_column(col_idx, col_idx, _column_width(max_length))
+        
+        # Save the workbook
+        wb.close()
+        _log.info("Successfully saved formatted Excel file: '%s'", excel_path)
         return True
         
     except Exception as e:
-        print(f"Error creating Excel file '{excel_path}': {e}")
+        _log.error("Error creating Excel file '%s': %s", excel_path, e)
         return False
 
 
-def markdown_table_to_excel_with_formatting(markdown_path: str, excel_path: str) -> bool:
+def parse_markdown(lines: List[str]) -> Optional[Tuple[List[str], List[List[str]]]]:
+    """
+    Parse the first Markdown table in a list of lines into headers and rows.
+    
+    Pure function with no file or workbook access, so it can run in any
+    worker process.
+    
+    Args:
+        lines: List of lines from the Markdown file
+        
+    Returns:
+        Tuple of (headers, data_rows), or None if no valid table was found
+    """
+    headers, data_rows, success = parse_markdown_table(lines)
+    
+    if not success:
+        return None
+    
+    # Rows wider than the header have no column to go into
+    for row in data_rows:
+        if len(row) > len(headers):
+            _log.error("Error: Table row has %d columns, header has only %d",
+                       len(row), len(headers))
+            return None
+    
+    return headers, data_rows
+
+
+def write_xlsx(headers: List[str], data_rows: List[List[str]], excel_path: str,
+               backend: Optional[str] = None) -> bool:
+    """
+    Write parsed table headers and rows to a formatted Excel file.
+    
+    Args:
+        headers: List of column headers
+        data_rows: List of lists containing row data
+        excel_path: Path where the Excel file should be saved
+        backend: Excel library to write with, 'openpyxl' or 'xlsxwriter'.
+            Defaults to openpyxl, or xlsxwriter when only it is installed.
+        
+    Returns:
+        True if successful, False if an error occurred
+    """
+    if backend is None:
+        backend = 'xlsxwriter' if XLSXWRITER_AVAILABLE and not OPENPYXL_AVAILABLE else 'openpyxl'
+    
+    if backend == 'xlsxwriter':
+        return create_formatted_excel_xlsxwriter(headers, data_rows, excel_path)
+    return create_formatted_excel(headers, data_rows, excel_path)
+
+
+def markdown_table_to_excel_with_formatting(markdown_path: str, excel_path: str,
+                                            backend: Optional[str] = None) -> bool:
     """
     Convert the first Markdown table in a file to a formatted Excel spreadsheet.
     
@@ -337,38 +668,63 @@ def markdown_table_to_excel_with_formatting(markdown_path: str, excel_path: str)
     Args:
         markdown_path: Path to the input Markdown file
         excel_path: Path for the output Excel file (.xlsx)
+        backend: Excel library to write with, 'openpyxl' or 'xlsxwriter'.
+            Defaults to openpyxl, or xlsxwriter when only it is installed.
         
     Returns:
         True if conversion was successful, False otherwise
     """
-    print(f"Reading Markdown file: {markdown_path}")
+    _log.info("Reading Markdown file: %s", markdown_path)
     
     try:
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Read and decode the whole file at once rather than line by line
+        with open(markdown_path, 'rb') as f:
+            data = f.read()
+        lines = data.decode('utf-8').splitlines()
     except FileNotFoundError:
-        print(f"Error: Input file not found: '{markdown_path}'")
+        _log.error("Error: Input file not found: '%s'", markdown_path)
         return False
     except Exception as e:
-        print(f"Error reading file '{markdown_path}': {e}")
+        _log.error("Error reading file '%s': %s", markdown_path, e)
         return False
     
     # Parse the Markdown table
-    headers, data_rows, success = parse_markdown_table(lines)
+    table = parse_markdown(lines)
     
-    if not success:
-        return False
-    
-    # Create DataFrame
-    try:
-        df = pd.DataFrame(data_rows, columns=headers)
-        print(f"Created DataFrame: {len(df)} rows × {len(df.columns)} columns")
-    except Exception as e:
-        print(f"Error creating DataFrame: {e}")
+    if table is None:
         return False
     
     # Create formatted Excel file
-    return create_formatted_excel(df, excel_path)
+    headers, data_rows = table
+    return write_xlsx(headers, data_rows, excel_path, backend=backend)
+
+
+def _convert_pair(pair: Tuple[str, str], backend: Optional[str] = None) -> bool:
+    """Convert one (markdown_path, excel_path) pair; picklable for worker processes."""
+    markdown_path, excel_path = pair
+    return markdown_table_to_excel_with_formatting(markdown_path, excel_path, backend=backend)
+
+
+def convert_many(pairs: List[Tuple[str, str]], workers: Optional[int] = None,
+                 backend: Optional[str] = None) -> List[bool]:
+    """
+    Convert several Markdown files to Excel in parallel worker processes.
+    
+    Excel serialization is CPU-bound pure Python, so separate processes scale
+    with the number of cores where threads would not. On platforms that spawn
+    workers (Windows, macOS), call this from under an
+    ``if __name__ == "__main__":`` guard.
+    
+    Args:
+        pairs: List of (markdown_path, excel_path) tuples
+        workers: Number of worker processes (defaults to os.cpu_count())
+        backend: Excel library to write with, see write_xlsx
+        
+    Returns:
+        List of per-pair success flags, in the order of ``pairs``
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(_convert_pair, backend=backend), pairs))
 
 
 def main() -> None:
@@ -398,14 +754,43 @@ def main() -> None:
         metavar='EXCEL_FILE'
     )
     
+    parser.add_argument(
+        '--backend',
+        choices=['openpyxl', 'xlsxwriter'],
+        default=None,
+        help='Excel library used to write the file (default: openpyxl, or '
+             'xlsxwriter when only it is installed)'
+    )
+    
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only report warnings and errors'
+    )
+    verbosity.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Also report per-line parsing details'
+    )
+    
     args = parser.parse_args()
     
+    if args.quiet:
+        log_level = logging.WARNING
+    elif args.verbose:
+        log_level = logging.DEBUG
+    else:
+        log_level = logging.INFO
+    logging.basicConfig(level=log_level, format='%(message)s')
+    
     # Validate output file extension
     if not args.outputfile.lower().endswith('.xlsx'):
         parser.error("Output file must have .xlsx extension")
     
     # Perform the conversion
-    success = markdown_table_to_excel_with_formatting(args.inputfile, args.outputfile)
+    success = markdown_table_to_excel_with_formatting(args.inputfile, args.outputfile,
+                                                      backend=args.backend)
     
     if not success:
         exit(1)